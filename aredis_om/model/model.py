@@ -4,15 +4,16 @@ import decimal
 import json
 import logging
 import operator
-from copy import copy
-from enum import Enum
-from functools import reduce
+from enum import Enum, IntEnum
+from functools import lru_cache, reduce
+from itertools import chain
 from typing import (
     AbstractSet,
     Any,
     Callable,
     ClassVar,
     Dict,
+    FrozenSet,
     List,
     Literal,
     Mapping,
@@ -26,8 +27,8 @@ from typing import (
 )
 from typing import get_args as typing_get_args
 from typing import no_type_check
+from weakref import WeakValueDictionary
 
-from more_itertools import ichunked
 from redis.commands.json.path import Path
 from redis.exceptions import ResponseError
 from typing_extensions import Protocol, get_args, get_origin
@@ -54,11 +55,24 @@ from .render_tree import render_tree
 from .token_escaper import TokenEscaper
 
 
-model_registry = {}
+try:
+    # orjson is optional, but decodes JSON documents from search results much
+    # faster than the standard library when it's installed.
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads  # type: ignore[assignment]
+
+
+# Weak references, so that models created dynamically (e.g. in tests) can be
+# garbage collected once nothing else refers to them.
+model_registry: "WeakValueDictionary[str, Type[RedisModel]]" = WeakValueDictionary()
 _T = TypeVar("_T")
 Model = TypeVar("Model", bound="RedisModel")
 log = logging.getLogger(__name__)
 escaper = TokenEscaper()
+# Query values tend to repeat (e.g. enum-like filters and IN lists), so keep
+# recently escaped values around rather than escaping them again.
+cached_escape = lru_cache(maxsize=4096)(escaper.escape)
 
 # For basic exact-match field types like an indexed string, we create a TAG
 # field in the RediSearch index. TAG is designed for multi-value fields
@@ -103,7 +117,7 @@ class NotFoundError(Exception):
     """Raised when a query found no results."""
 
 
-class Operators(Enum):
+class Operators(IntEnum):
     EQ = 1
     NE = 2
     LT = 3
@@ -184,6 +198,46 @@ def decode_redis_value(
         return obj.decode(encoding)
 
 
+def hash_document(
+    model: "RedisModel", include: Optional[Set[str]] = None
+) -> Dict[str, Any]:
+    """Build the HSET mapping for a hash model's fields."""
+    # Leave out values which are `None` because they are not valid in a
+    # HSET. Plain strings and numbers are stored as they are; only other
+    # values (dates, enums, decimals, etc.) need to go through the encoder.
+    return {
+        k: v if type(v) in HASH_PASSTHROUGH_TYPES else jsonable_encoder(v)
+        for k, v in model.dict(include=include).items()
+        if v is not None
+    }
+
+
+def cached_per_class(
+    cls: type, name: str, build: Callable[[], _T], key: Any = None
+) -> _T:
+    """
+    Return the value cached as `name` on this class, calling `build` to create
+    it the first time, or again whenever `key` changes.
+    """
+    # Read from the class __dict__ rather than with getattr() so that a
+    # subclass, which has its own fields, schema and Meta, never reuses a
+    # value cached on its parent class.
+    cached = cls.__dict__.get(name)
+    if cached is None or cached[0] is not key:
+        cached = (key, build())
+        setattr(cls, name, cached)
+    return cached[1]
+
+
+def json_commands(model_cls: Type["RedisModel"]) -> Any:
+    """Return the JSON command wrapper for a model class's database."""
+    # redis-py builds a new JSON command wrapper, and re-registers all of its
+    # response callbacks, on every call to json(). Reuse the wrapper for as
+    # long as the model is talking to the same client.
+    db = model_cls.db()
+    return cached_per_class(model_cls, "_json_client", db.json, key=db)
+
+
 # TODO: replace with `str.removeprefix()` when only Python 3.9+ is supported
 def remove_prefix(value: str, prefix: str) -> str:
     """Remove a prefix from a string."""
@@ -219,6 +273,9 @@ class NegatedExpression:
     better design is probably possible, maybe at least an ExpressionProtocol?
     """
 
+    # Queries build many of these, so skip the per-instance __dict__.
+    __slots__ = ("expression",)
+
     expression: "Expression"
 
     def __invert__(self):
@@ -260,6 +317,9 @@ class NegatedExpression:
 
 @dataclasses.dataclass
 class Expression:
+    # Queries build many of these, so skip the per-instance __dict__.
+    __slots__ = ("op", "left", "right", "parents")
+
     op: Operators
     left: Optional[ExpressionOrModelField]
     right: Optional[ExpressionOrModelField]
@@ -291,8 +351,14 @@ class KNNExpression:
     vector_field: ModelField
     reference_vector: bytes
 
+    def __post_init__(self):
+        # Render these once, since they're needed for every query built from
+        # this expression.
+        self._str = f"KNN $K @{self.vector_field.name} $knn_ref_vector"
+        self._score_field = f"__{self.vector_field.name}_score"
+
     def __str__(self):
-        return f"KNN $K @{self.vector_field.name} $knn_ref_vector"
+        return self._str
 
     @property
     def query_params(self) -> Dict[str, Union[str, bytes]]:
@@ -300,7 +366,7 @@ class KNNExpression:
 
     @property
     def score_field(self) -> str:
-        return f"__{self.vector_field.name}_score"
+        return self._score_field
 
 
 ExpressionOrNegated = Union[Expression, NegatedExpression]
@@ -409,9 +475,31 @@ class RediSearchFieldTypes(Enum):
     GEO = "GEO"
 
 
+# How much a single comparison on each field type typically narrows a query,
+# most selective first. FindQuery(reorder=True) uses this to put the terms
+# that match the fewest documents first.
+FIELD_TYPE_SELECTIVITY = {
+    RediSearchFieldTypes.TAG: 0,
+    RediSearchFieldTypes.NUMERIC: 1,
+    RediSearchFieldTypes.GEO: 2,
+    RediSearchFieldTypes.TEXT: 3,
+}
+
 # TODO: How to handle Geo fields?
 NUMERIC_TYPES = (float, int, decimal.Decimal)
+# Container types that a HashModel cannot store in a flat Redis hash.
+HASH_UNSUPPORTED_CONTAINER_TYPES = (Set, Mapping, List)
+
+# Value types that a HashModel can hand to HSET without encoding them first.
+HASH_PASSTHROUGH_TYPES = frozenset((str, int, float))
+
+# How many keys to ask Redis to look at per SCAN call in all_pks(). The
+# server default of 10 means many round trips on large keyspaces.
+ALL_PKS_SCAN_COUNT = 1000
 DEFAULT_PAGE_SIZE = 1000
+PAGES_PER_PIPELINE = 8
+# How many keys FindQuery.delete() sends in each UNLINK command.
+DELETE_CHUNK_SIZE = 500
 
 
 class FindQuery:
@@ -425,6 +513,7 @@ class FindQuery:
         page_size: int = DEFAULT_PAGE_SIZE,
         sort_fields: Optional[List[str]] = None,
         nocontent: bool = False,
+        reorder: bool = False,
     ):
         if not has_redisearch(model.db()):
             raise RedisModelError(
@@ -433,24 +522,28 @@ class FindQuery:
                 "instance has one of these modules installed."
             )
 
-        self.expressions = expressions
+        # Expressions and sort fields are stored as tuples so that copies of
+        # this query made by copy() can share them.
+        self.expressions = tuple(expressions)
         self.model = model
         self.knn = knn
         self.offset = offset
         self.limit = limit or (self.knn.k if self.knn else DEFAULT_PAGE_SIZE)
         self.page_size = page_size
         self.nocontent = nocontent
+        self.reorder = reorder
 
         if sort_fields:
-            self.sort_fields = self.validate_sort_fields(sort_fields)
+            self.sort_fields = tuple(self.validate_sort_fields(sort_fields))
         elif self.knn:
-            self.sort_fields = [self.knn.score_field]
+            self.sort_fields = (self.knn.score_field,)
         else:
-            self.sort_fields = []
+            self.sort_fields = ()
 
         self._expression = None
         self._query: Optional[str] = None
-        self._pagination: List[str] = []
+        self._pagination: Tuple[Any, ...] = ()
+        self._sort_args: Tuple[str, ...] = ()
         self._model_cache: List[RedisModel] = []
 
     def dict(self) -> Dict[str, Any]:
@@ -459,15 +552,29 @@ class FindQuery:
             offset=self.offset,
             page_size=self.page_size,
             limit=self.limit,
-            expressions=copy(self.expressions),
-            sort_fields=copy(self.sort_fields),
+            expressions=self.expressions,
+            sort_fields=self.sort_fields,
             nocontent=self.nocontent,
+            reorder=self.reorder,
         )
 
     def copy(self, **kwargs):
         original = self.dict()
         original.update(**kwargs)
-        return FindQuery(**original)
+        query = FindQuery(**original)
+        # The resolved query string only depends on the expressions, their
+        # ordering and the KNN clause, so a copy that shares them can reuse it
+        # instead of walking the expression tree again, e.g. for every page of
+        # results.
+        if (
+            self._query
+            and query.expressions is self.expressions
+            and query.reorder == self.reorder
+            and not self.knn
+            and not query.knn
+        ):
+            query._query = self._query
+        return query
 
     @property
     def pagination(self):
@@ -476,12 +583,22 @@ class FindQuery:
         self._pagination = self.resolve_redisearch_pagination()
         return self._pagination
 
+    @property
+    def sort_args(self):
+        if self._sort_args:
+            return self._sort_args
+        self._sort_args = self.resolve_redisearch_sort_fields() or ()
+        return self._sort_args
+
     @property
     def expression(self):
         if self._expression:
             return self._expression
         if self.expressions:
-            self._expression = reduce(operator.and_, self.expressions)
+            expressions: Sequence[ExpressionOrNegated] = self.expressions
+            if self.reorder:
+                expressions = sorted(expressions, key=self.estimate_term_cost)
+            self._expression = reduce(operator.and_, expressions)
         else:
             self._expression = Expression(
                 left=None, right=None, op=Operators.ALL, parents=[]
@@ -509,11 +626,27 @@ class FindQuery:
 
     @property
     def query_params(self):
-        params: List[Union[str, bytes]] = []
-        if self.knn:
-            params += [attr for kv in self.knn.query_params.items() for attr in kv]
+        if not self.knn:
+            return []
+        params: List[Union[str, bytes]] = [
+            attr for kv in self.knn.query_params.items() for attr in kv
+        ]
         return params
 
+    @classmethod
+    def estimate_term_cost(cls, expression: ExpressionOrNegated) -> int:
+        """
+        Estimate how many documents a top-level query term matches, relative
+        to other terms, based on the type of field it compares. Combined and
+        negated terms sort after single-field comparisons.
+        """
+        if isinstance(expression, Expression) and isinstance(
+            expression.left, (ModelField, PydanticFieldInfo)
+        ):
+            field_type = cls.resolve_field_type(expression.left, expression.op)
+            return FIELD_TYPE_SELECTIVITY[field_type]
+        return len(FIELD_TYPE_SELECTIVITY)
+
     def validate_sort_fields(self, sort_fields: List[str]):
         for sort_field in sort_fields:
             field_name = sort_field.lstrip("-")
@@ -524,15 +657,7 @@ class FindQuery:
                     f"You tried sort by {field_name}, but that field "
                     f"does not exist on the model {self.model}"
                 )
-            field_proxy = getattr(self.model, field_name)
-            if isinstance(field_proxy.field, FieldInfo) or isinstance(
-                field_proxy.field, PydanticFieldInfo
-            ):
-                field_info = field_proxy.field
-            else:
-                field_info = field_proxy.field.field_info
-
-            if not getattr(field_info, "sortable", False):
+            if field_name not in self.model._meta._sortable_fields:
                 raise QueryNotSupportedError(
                     f"You tried sort by {field_name}, but {self.model} does "
                     f"not define that field as sortable. Docs: {ERRORS_URL}#E2"
@@ -540,9 +665,12 @@ class FindQuery:
         return sort_fields
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def resolve_field_type(
         field: Union[ModelField, PydanticFieldInfo], op: Operators
     ) -> RediSearchFieldTypes:
+        # NOTE: Fields hash by identity and don't change once their model class
+        # is built, so the result for a field and operator can be cached.
         field_info: Union[FieldInfo, ModelField, PydanticFieldInfo]
 
         if not hasattr(field, "field_info"):
@@ -607,21 +735,21 @@ class FindQuery:
     @staticmethod
     def expand_tag_value(value):
         if isinstance(value, str):
-            return escaper.escape(value)
+            return cached_escape(value)
         if isinstance(value, bytes):
             # TODO: We don't decode bytes objects passed as input. Should we?
             # TODO: TAG indexes fail on JSON arrays of numbers -- only strings
             #  are allowed -- what happens if we save an array of bytes?
             return value
         try:
-            return "|".join([escaper.escape(str(v)) for v in value])
+            return "|".join([cached_escape(str(v)) for v in value])
         except TypeError:
             log.debug(
                 "Escaping single non-iterable value used for an IN or "
                 "NOT_IN query: %s",
                 value,
             )
-        return escaper.escape(str(value))
+        return cached_escape(str(value))
 
     @classmethod
     def resolve_value(
@@ -687,9 +815,7 @@ class FindQuery:
                     )
                     return ""
                 if isinstance(value, bool):
-                    result = "@{field_name}:{{{value}}}".format(
-                        field_name=field_name, value=value
-                    )
+                    result = f"@{field_name}:{{{value}}}"
                 elif isinstance(value, int):
                     # This if will hit only if the field is a primary key of type int
                     result = f"@{field_name}:[{value} {value}]"
@@ -697,54 +823,39 @@ class FindQuery:
                     # The value contains the TAG field separator. We can work
                     # around this by breaking apart the values and unioning them
                     # with multiple field:{} queries.
-                    values: filter = filter(None, value.split(separator_char))
-                    for value in values:
-                        value = escaper.escape(value)
-                        result += "@{field_name}:{{{value}}}".format(
-                            field_name=field_name, value=value
-                        )
-                else:
-                    value = escaper.escape(value)
-                    result += "@{field_name}:{{{value}}}".format(
-                        field_name=field_name, value=value
+                    result += "".join(
+                        f"@{field_name}:{{{cached_escape(part)}}}"
+                        for part in value.split(separator_char)
+                        if part
                     )
+                else:
+                    value = cached_escape(value)
+                    result += f"@{field_name}:{{{value}}}"
             elif op is Operators.NE:
-                value = escaper.escape(value)
-                result += "-(@{field_name}:{{{value}}})".format(
-                    field_name=field_name, value=value
-                )
+                value = cached_escape(value)
+                result += f"-(@{field_name}:{{{value}}})"
             elif op is Operators.IN:
                 expanded_value = cls.expand_tag_value(value)
-                result += "(@{field_name}:{{{expanded_value}}})".format(
-                    field_name=field_name, expanded_value=expanded_value
-                )
+                result += f"(@{field_name}:{{{expanded_value}}})"
             elif op is Operators.NOT_IN:
                 # TODO: Implement NOT_IN, test this...
                 expanded_value = cls.expand_tag_value(value)
-                result += "-(@{field_name}:{{{expanded_value}}})".format(
-                    field_name=field_name, expanded_value=expanded_value
-                )
+                result += f"-(@{field_name}:{{{expanded_value}}})"
             elif op is Operators.STARTSWITH:
                 expanded_value = cls.expand_tag_value(value)
-                result += "(@{field_name}:{{{expanded_value}*}})".format(
-                    field_name=field_name, expanded_value=expanded_value
-                )
+                result += f"(@{field_name}:{{{expanded_value}*}})"
             elif op is Operators.ENDSWITH:
                 expanded_value = cls.expand_tag_value(value)
-                result += "(@{field_name}:{{*{expanded_value}}})".format(
-                    field_name=field_name, expanded_value=expanded_value
-                )
+                result += f"(@{field_name}:{{*{expanded_value}}})"
             elif op is Operators.CONTAINS:
                 expanded_value = cls.expand_tag_value(value)
-                result += "(@{field_name}:{{*{expanded_value}*}})".format(
-                    field_name=field_name, expanded_value=expanded_value
-                )
+                result += f"(@{field_name}:{{*{expanded_value}*}})"
 
         return result
 
     def resolve_redisearch_pagination(self):
         """Resolve pagination options for a query."""
-        return ["LIMIT", self.offset, self.limit]
+        return ("LIMIT", self.offset, self.limit)
 
     def resolve_redisearch_sort_fields(self):
         """Resolve sort options for a query."""
@@ -755,7 +866,7 @@ class FindQuery:
             direction = "desc" if f.startswith("-") else "asc"
             fields.extend([f.lstrip("-"), direction])
         if self.sort_fields:
-            return ["SORTBY", *fields]
+            return ("SORTBY", *fields)
 
     @classmethod
     def resolve_redisearch_query(cls, expression: ExpressionOrNegated) -> str:
@@ -799,9 +910,7 @@ class FindQuery:
                 )
             return "*"
 
-        if isinstance(expression.left, Expression) or isinstance(
-            expression.left, NegatedExpression
-        ):
+        if isinstance(expression.left, (Expression, NegatedExpression)):
             result += f"({cls.resolve_redisearch_query(expression.left)})"
         elif isinstance(expression.left, ModelField):
             field_type = cls.resolve_field_type(expression.left, expression.op)
@@ -834,7 +943,7 @@ class FindQuery:
 
         right = expression.right
 
-        if isinstance(right, Expression) or isinstance(right, NegatedExpression):
+        if isinstance(right, (Expression, NegatedExpression)):
             if expression.op == Operators.AND:
                 result += " "
             elif expression.op == Operators.OR:
@@ -886,19 +995,16 @@ class FindQuery:
             *self.pagination,
         ]
         if self.sort_fields:
-            args += self.resolve_redisearch_sort_fields()
+            args += self.sort_args
 
-        if self.query_params:
-            args += ["PARAMS", str(len(self.query_params))] + self.query_params
+        query_params = self.query_params
+        if query_params:
+            args += ["PARAMS", str(len(query_params))] + query_params
 
         if self.knn:
-            # Ensure DIALECT is at least 2
-            if "DIALECT" not in args:
-                args += ["DIALECT", "2"]
-            else:
-                i_dialect = args.index("DIALECT") + 1
-                if int(args[i_dialect]) < 2:
-                    args[i_dialect] = "2"
+            # KNN queries need at least DIALECT 2. Nothing above sets a
+            # dialect, so there's no existing DIALECT argument to check.
+            args += ["DIALECT", "2"]
 
         if self.nocontent:
             args.append("NOCONTENT")
@@ -928,17 +1034,29 @@ class FindQuery:
 
         # Transparently (to the user) make subsequent requests to paginate
         # through the results and finally return them all.
-        query = self
-        while True:
-            # Make a query for each pass of the loop, with a new offset equal to the
-            # current offset plus `page_size`, until we stop getting results back.
-            query = query.copy(offset=query.offset + query.page_size)
-            _results = await query.execute(exhaust_results=False)
-            if not _results:
-                break
-            self._model_cache += _results
+        async for raw_page in self._remaining_pages(count):
+            self._model_cache += self.model.from_redis(raw_page)
         return self._model_cache
 
+    async def _remaining_pages(self, count: int):
+        """
+        Yield the raw results for every page after this query's offset, up to
+        `count` results. The pages are requested several at a time in a
+        pipeline instead of with one round trip each.
+        """
+        # Every page uses the same arguments apart from the LIMIT offset, so
+        # build them once and only patch the offset for each page.
+        _, page_args = await self.execute(return_query_args=True)
+        offset_index = page_args.index("LIMIT") + 1
+        offsets = range(self.offset + self.page_size, count, self.page_size)
+        for start in range(0, len(offsets), PAGES_PER_PIPELINE):
+            pipeline = self.model.db().pipeline(transaction=False)
+            for offset in offsets[start : start + PAGES_PER_PIPELINE]:  # noqa: E203
+                page_args[offset_index] = offset
+                await pipeline.execute_command(*page_args)
+            for raw_page in await pipeline.execute():
+                yield raw_page
+
     async def get_query(self):
         query = self.copy()
         return await query.execute(return_query_args=True)
@@ -984,11 +1102,10 @@ class FindQuery:
 
         # TODO: async for here?
         for model in await self.all():
-            for field, value in field_values.items():
-                setattr(model, field, value)
             # TODO: In the non-transaction case, can we do more to detect
             #  failure responses from Redis?
-            await model.save(pipeline=pipeline)
+            # The models were just returned by the query, so they're stored.
+            await model._update_fields(field_values, pipeline=pipeline, stored=True)
 
         if pipeline:
             # TODO: Response type?
@@ -998,17 +1115,51 @@ class FindQuery:
     async def delete(self):
         """Delete all matching records in this query."""
         # TODO: Better response type, error detection
-        try:
-            return await self.model.db().delete(*[m.key() for m in await self.all()])
-        except ResponseError:
-            return 0
+        # We only need the keys of the matching documents, so ask for the
+        # results without content rather than loading every model.
+        query = self.copy(nocontent=True)
+        deleted = 0
+        # Deleting a page of matches moves the next matches up to this
+        # query's offset, so keep deleting the page there until nothing is
+        # left. Only one page of keys is held at a time, and they're
+        # unlinked in bounded chunks rather than with one huge command.
+        while True:
+            keys = (await query.execute(return_raw_result=True))[1:]
+            if not keys:
+                break
+            pipeline = self.model.db().pipeline(transaction=False)
+            for start in range(0, len(keys), DELETE_CHUNK_SIZE):
+                chunk = keys[start : start + DELETE_CHUNK_SIZE]  # noqa: E203
+                await pipeline.unlink(*chunk)
+            try:
+                page_deleted = sum(await pipeline.execute())
+            except ResponseError:
+                break
+            # Stop rather than search forever if the index still returns keys
+            # that are already gone.
+            if not page_deleted:
+                break
+            deleted += page_deleted
+        return deleted
 
     async def __aiter__(self):
         if self._model_cache:
             for m in self._model_cache:
                 yield m
-        else:
-            for m in await self.execute():
+            return
+
+        # Decode and yield the results a page at a time, rather than loading
+        # every result before yielding the first one. Only a result set that
+        # fits in one page goes into the query cache; caching a longer one
+        # would hold every result in memory again.
+        raw_result = await self.execute(return_raw_result=True)
+        results = self.model.from_redis(raw_result)
+        if raw_result[0] <= len(results):
+            self._model_cache = results
+        for m in results:
+            yield m
+        async for raw_page in self._remaining_pages(raw_result[0]):
+            for m in self.model.from_redis(raw_page):
                 yield m
 
     def __getitem__(self, item: int):
@@ -1030,12 +1181,12 @@ class FindQuery:
                 "Cannot use [] notation with async code. "
                 "Use FindQuery.get_item() instead."
             )
-        if self._model_cache and len(self._model_cache) >= item:
+        if self._model_cache and len(self._model_cache) > item:
             return self._model_cache[item]
 
         query = self.copy(offset=item, limit=1)
 
-        return query.execute()[0]  # noqa
+        return query.execute(exhaust_results=False)[0]  # noqa
 
     async def get_item(self, item: int):
         """
@@ -1054,11 +1205,11 @@ class FindQuery:
         NOTE: This method is included specifically for async users, who
         cannot use the notation Model.find()[1000].
         """
-        if self._model_cache and len(self._model_cache) >= item:
+        if self._model_cache and len(self._model_cache) > item:
             return self._model_cache[item]
 
         query = self.copy(offset=item, limit=1)
-        result = await query.execute()
+        result = await query.execute(exhaust_results=False)
         return result[0]
 
 
@@ -1123,6 +1274,10 @@ class VectorFieldOptions:
         HNSW = "HNSW"
 
     class TYPE(Enum):
+        # The half-precision types need RediSearch 2.10 or later. They halve
+        # the memory the index uses for each vector.
+        FLOAT16 = "FLOAT16"
+        BFLOAT16 = "BFLOAT16"
         FLOAT32 = "FLOAT32"
         FLOAT64 = "FLOAT64"
 
@@ -1285,6 +1440,11 @@ class BaseMeta(Protocol):
     index_name: str
     embedded: bool
     encoding: str
+    # Set up by ModelMeta for each model class.
+    _create_pk: Callable[..., str]
+    _key_prefix: str
+    _sortable_fields: FrozenSet[str]
+    _pk_attr_name: str
 
 
 @dataclasses.dataclass
@@ -1330,9 +1490,9 @@ class ModelMeta(ModelMetaclass):
             new_class.Meta = meta
             new_class._meta = meta
         elif base_meta:
-            new_class._meta = type(
-                f"{new_class.__name__}Meta", (base_meta,), dict(base_meta.__dict__)
-            )
+            # Settings we don't override are inherited from base_meta through
+            # the MRO, so there's no need to copy its __dict__.
+            new_class._meta = type(f"{new_class.__name__}Meta", (base_meta,), {})
             new_class.Meta = new_class._meta
             # Unset inherited values we don't want to reuse (typically based on
             # the model name).
@@ -1346,6 +1506,8 @@ class ModelMeta(ModelMetaclass):
 
         # Create proxies for each model field so that we can use the field
         # in queries, like Model.get(Model.field_name == 1)
+        annotations = new_class.get_annotations()
+        sortable_fields = set()
         for field_name, field in new_class.__fields__.items():
             if not isinstance(field, FieldInfo):
                 for base_candidate in bases:
@@ -1360,7 +1522,13 @@ class ModelMeta(ModelMetaclass):
             if not field.alias:
                 field.alias = field_name
             setattr(new_class, field_name, ExpressionProxy(field, []))
-            annotation = new_class.get_annotations().get(field_name)
+            if isinstance(field, (FieldInfo, PydanticFieldInfo)):
+                sortable = getattr(field, "sortable", False)
+            else:
+                sortable = getattr(field.field_info, "sortable", False)
+            if sortable:
+                sortable_fields.add(field_name)
+            annotation = annotations.get(field_name)
             if annotation:
                 new_class.__annotations__[field_name] = Union[
                     annotation, ExpressionProxy
@@ -1387,6 +1555,18 @@ class ModelMeta(ModelMetaclass):
                     setattr(new_class, score_attr, None)
                     new_class.__annotations__[score_attr] = Union[float, None]
 
+        # Sort fields are checked against this set when building queries,
+        # rather than inspecting each field's FieldInfo on every query.
+        new_class._meta._sortable_fields = frozenset(sortable_fields)
+
+        # Resolve the attribute that holds the primary key once per class, so
+        # that key() doesn't need to inspect the field on every call.
+        primary_key = getattr(new_class._meta, "primary_key", None)
+        if primary_key is not None:
+            new_class._meta._pk_attr_name = getattr(
+                primary_key.field, "name", primary_key.name
+            )
+
         if not getattr(new_class._meta, "global_key_prefix", None):
             new_class._meta.global_key_prefix = getattr(
                 base_meta, "global_key_prefix", ""
@@ -1410,12 +1590,21 @@ class ModelMeta(ModelMetaclass):
             new_class._meta.primary_key_creator_cls = getattr(
                 base_meta, "primary_key_creator_cls", UlidPrimaryKey
             )
+        # Creators are instantiated once per model class rather than for
+        # every new model instance.
+        new_class._meta._create_pk = new_class._meta.primary_key_creator_cls().create_pk
         # TODO: Configurable key separate, defaults to ":"
         if not getattr(new_class._meta, "index_name", None):
             new_class._meta.index_name = (
                 f"{new_class._meta.global_key_prefix}:"
                 f"{new_class._meta.model_key_prefix}:index"
             )
+        # Keys are built for every save, get and delete, so join the key
+        # prefixes once here rather than in every make_key() call.
+        new_class._meta._key_prefix = (
+            f"{new_class._meta.global_key_prefix.strip(':')}:"
+            f"{new_class._meta.model_key_prefix.strip(':')}:"
+        )
 
         # Not an abstract model class or embedded model, so we should let the
         # Migrator create indexes for it.
@@ -1478,11 +1667,7 @@ class RedisModel(BaseModel, abc.ABC, metaclass=ModelMeta):
 
     def key(self):
         """Return the Redis key for this model."""
-        if hasattr(self._meta.primary_key.field, "name"):
-            pk = getattr(self, self._meta.primary_key.field.name)
-        else:
-            pk = getattr(self, self._meta.primary_key.name)
-        return self.make_primary_key(pk)
+        return self.make_primary_key(getattr(self, type(self)._meta._pk_attr_name))
 
     @classmethod
     async def _delete(cls, db, *pks):
@@ -1501,10 +1686,40 @@ class RedisModel(BaseModel, abc.ABC, metaclass=ModelMeta):
     async def get(cls: Type["Model"], pk: Any) -> "Model":
         raise NotImplementedError
 
+    @classmethod
+    async def get_many(
+        cls: Type["Model"], pks: Sequence[Any]
+    ) -> List[Optional["Model"]]:
+        """
+        Get the models with the given primary keys in one round trip. The
+        result has one entry per key, in order, with None for missing models.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def _parse_document(cls: Type["Model"], document: Any) -> "Model":
+        raise NotImplementedError
+
     async def update(self, **field_values):
         """Update this model instance with the specified key-value pairs."""
         raise NotImplementedError
 
+    async def _update_fields(
+        self,
+        field_values: Dict[str, Any],
+        pipeline: Optional[redis.client.Pipeline] = None,
+        stored: bool = False,
+    ):
+        """
+        Set already-validated fields on this model and write it to Redis.
+
+        Pass stored=True only when the model is known to be stored at its key,
+        e.g. because it was just returned by a query.
+        """
+        for field, value in field_values.items():
+            setattr(self, field, value)
+        await self.save(pipeline=pipeline)
+
     async def save(
         self: "Model", pipeline: Optional[redis.client.Pipeline] = None
     ) -> "Model":
@@ -1521,12 +1736,18 @@ class RedisModel(BaseModel, abc.ABC, metaclass=ModelMeta):
     @validator("pk", always=True, allow_reuse=True)
     def validate_pk(cls, v):
         if not v or isinstance(v, ExpressionProxy):
-            v = cls._meta.primary_key_creator_cls().create_pk()
+            v = cls._meta._create_pk()
         return v
 
     @classmethod
     def validate_primary_key(cls):
         """Check for a primary key. We need one (and only one)."""
+        # The fields don't change after the first successful check, so only
+        # run it once per model class rather than for every new instance.
+        cached_per_class(cls, "_primary_key_validated", cls._check_primary_key)
+
+    @classmethod
+    def _check_primary_key(cls):
         primary_keys = 0
         for name, field in cls.__fields__.items():
             if not hasattr(field, "field_info"):
@@ -1550,12 +1771,28 @@ class RedisModel(BaseModel, abc.ABC, metaclass=ModelMeta):
             cls.__fields__.pop("pk")
         elif primary_keys > 2:
             raise RedisModelError("You must define only one primary key for a model")
+        return True
+
+    @classmethod
+    async def _scan_pks(cls, key_type: str):
+        """Yield the primary keys of all models of this class stored in Redis."""
+        key_prefix = cls.make_key(cls._meta.primary_key_pattern.format(pk=""))
+        prefix_length = len(key_prefix)
+        encoding = cls.Meta.encoding
+        async for key in cls.db().scan_iter(
+            f"{key_prefix}*", count=ALL_PKS_SCAN_COUNT, _type=key_type
+        ):
+            # TODO: We need to decide how we want to handle the lack of
+            #  decode_responses=True...
+            if isinstance(key, bytes):
+                key = key.decode(encoding)
+            # The SCAN pattern treats glob characters in the prefix specially,
+            # so check that the key really starts with the prefix.
+            yield key[prefix_length:] if key.startswith(key_prefix) else key
 
     @classmethod
     def make_key(cls, part: str):
-        global_prefix = getattr(cls._meta, "global_key_prefix", "").strip(":")
-        model_prefix = getattr(cls._meta, "model_key_prefix", "").strip(":")
-        return f"{global_prefix}:{model_prefix}:{part}"
+        return f"{cls._meta._key_prefix}{part}"
 
     @classmethod
     def make_primary_key(cls, pk: Any):
@@ -1571,20 +1808,13 @@ class RedisModel(BaseModel, abc.ABC, metaclass=ModelMeta):
         cls,
         *expressions: Union[Any, Expression],
         knn: Optional[KNNExpression] = None,
+        reorder: bool = False,
     ) -> FindQuery:
-        return FindQuery(expressions=expressions, knn=knn, model=cls)
+        return FindQuery(expressions=expressions, knn=knn, model=cls, reorder=reorder)
 
     @classmethod
     def from_redis(cls, res: Any):
         # TODO: Parsing logic copied from redisearch-py. Evaluate.
-        def to_string(s):
-            if isinstance(s, (str,)):
-                return s
-            elif isinstance(s, bytes):
-                return s.decode(errors="ignore")
-            else:
-                return s  # Not a string we care about
-
         docs = []
         step = 2  # Because the result has content
         offset = 1  # The first item is the count of total matches.
@@ -1592,15 +1822,18 @@ class RedisModel(BaseModel, abc.ABC, metaclass=ModelMeta):
         for i in range(1, len(res), step):
             if res[i + offset] is None:
                 continue
-            fields: Dict[str, str] = dict(
-                zip(
-                    map(to_string, res[i + offset][::2]),
-                    map(to_string, res[i + offset][1::2]),
+            # Pair up consecutive items instead of slicing the row twice, and
+            # decode any bytes inline rather than calling a helper per item.
+            row = iter(res[i + offset])
+            fields: Dict[str, str] = {
+                (k.decode(errors="ignore") if isinstance(k, bytes) else k): (
+                    v.decode(errors="ignore") if isinstance(v, bytes) else v
                 )
-            )
+                for k, v in zip(row, row)
+            }
             # $ means a json entry
             if fields.get("$"):
-                json_fields = json.loads(fields.pop("$"))
+                json_fields = json_loads(fields.pop("$"))
                 doc = cls(**json_fields)
                 for k, v in fields.items():
                     if k.startswith("__") and k.endswith("_score"):
@@ -1660,11 +1893,18 @@ class RedisModel(BaseModel, abc.ABC, metaclass=ModelMeta):
         models: Sequence["RedisModel"],
         pipeline: Optional[redis.client.Pipeline] = None,
     ) -> int:
-        db = cls._get_db(pipeline)
+        db = cls._get_db(pipeline, bulk=True)
+
+        # UNLINK frees the values in the background, so deleting many (or
+        # large) models doesn't block the server the way DEL would.
+        for start in range(0, len(models), 100):
+            pks = [model.key() for model in models[start : start + 100]]  # noqa: E203
+            await db.unlink(*pks)
 
-        for chunk in ichunked(models, 100):
-            pks = [model.key() for model in chunk]
-            await cls._delete(db, *pks)
+        # If the user didn't give us a pipeline, then we need to execute
+        # the one we just created, so that all chunks go in one round trip.
+        if pipeline is None:
+            await db.execute()
 
         return len(models)
 
@@ -1681,7 +1921,10 @@ class RedisModel(BaseModel, abc.ABC, metaclass=ModelMeta):
         else:
             from pydantic import TypeAdapter
 
-            adapter = TypeAdapter(self.__class__)
+            # Building a TypeAdapter compiles a validator, so build one per
+            # class.
+            cls = self.__class__
+            adapter = cached_per_class(cls, "_type_adapter", lambda: TypeAdapter(cls))
             adapter.validate_python(self.__dict__)
 
 
@@ -1689,42 +1932,32 @@ class HashModel(RedisModel, abc.ABC):
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
 
-        if hasattr(cls, "__annotations__"):
-            for name, field_type in cls.__annotations__.items():
-                origin = get_origin(field_type)
-                for typ in (Set, Mapping, List):
-                    if isinstance(origin, type) and issubclass(origin, typ):
-                        raise RedisModelError(
-                            f"HashModels cannot index set, list, "
-                            f"or mapping fields. Field: {name}"
-                        )
-                if isinstance(field_type, type) and issubclass(field_type, RedisModel):
-                    raise RedisModelError(
-                        f"HashModels cannot index embedded model fields. Field: {name}"
-                    )
-                elif isinstance(field_type, type) and dataclasses.is_dataclass(
-                    field_type
-                ):
-                    raise RedisModelError(
-                        f"HashModels cannot index dataclass fields. Field: {name}"
-                    )
-
-        for name, field in cls.__fields__.items():
-            outer_type = outer_type_or_annotation(field)
-            origin = get_origin(outer_type)
-            if origin:
-                for typ in (Set, Mapping, List):
-                    if issubclass(origin, typ):
-                        raise RedisModelError(
-                            f"HashModels cannot index set, list, "
-                            f"or mapping fields. Field: {name}"
-                        )
-
-            if issubclass(outer_type, RedisModel):
+        # With Pydantic v2, __fields__ still holds the parent's fields at this
+        # point, so we check the annotations declared on this class as well.
+        # Both sources are validated in a single pass.
+        field_types = chain(
+            getattr(cls, "__annotations__", {}).items(),
+            (
+                (name, outer_type_or_annotation(field))
+                for name, field in cls.__fields__.items()
+            ),
+        )
+        for name, field_type in field_types:
+            origin = get_origin(field_type)
+            if isinstance(origin, type) and issubclass(
+                origin, HASH_UNSUPPORTED_CONTAINER_TYPES
+            ):
+                raise RedisModelError(
+                    f"HashModels cannot index set, list, "
+                    f"or mapping fields. Field: {name}"
+                )
+            if not isinstance(field_type, type):
+                continue
+            if issubclass(field_type, RedisModel):
                 raise RedisModelError(
                     f"HashModels cannot index embedded model fields. Field: {name}"
                 )
-            elif dataclasses.is_dataclass(outer_type):
+            elif dataclasses.is_dataclass(field_type):
                 raise RedisModelError(
                     f"HashModels cannot index dataclass fields. Field: {name}"
                 )
@@ -1734,33 +1967,37 @@ class HashModel(RedisModel, abc.ABC):
     ) -> "Model":
         self.check()
         db = self._get_db(pipeline)
-        document = jsonable_encoder(self.dict())
-
-        # filter out values which are `None` because they are not valid in a HSET
-        document = {k: v for k, v in document.items() if v is not None}
+        document = hash_document(self)
         # TODO: Wrap any Redis response errors in a custom exception?
         await db.hset(self.key(), mapping=document)
         return self
 
     @classmethod
     async def all_pks(cls):  # type: ignore
-        key_prefix = cls.make_key(cls._meta.primary_key_pattern.format(pk=""))
-        # TODO: We need to decide how we want to handle the lack of
-        #  decode_responses=True...
-        return (
-            (
-                remove_prefix(key, key_prefix)
-                if isinstance(key, str)
-                else remove_prefix(key.decode(cls.Meta.encoding), key_prefix)
-            )
-            async for key in cls.db().scan_iter(f"{key_prefix}*", _type="HASH")
-        )
+        return cls._scan_pks("HASH")
 
     @classmethod
     async def get(cls: Type["Model"], pk: Any) -> "Model":
         document = await cls.db().hgetall(cls.make_primary_key(pk))
         if not document:
             raise NotFoundError
+        return cls._parse_document(document)
+
+    @classmethod
+    async def get_many(
+        cls: Type["Model"], pks: Sequence[Any]
+    ) -> List[Optional["Model"]]:
+        pipeline = cls.db().pipeline(transaction=False)
+        for pk in pks:
+            await pipeline.hgetall(cls.make_primary_key(pk))
+        documents = await pipeline.execute()
+        return [
+            cls._parse_document(document) if document else None
+            for document in documents
+        ]
+
+    @classmethod
+    def _parse_document(cls: Type["Model"], document: Any) -> "Model":
         try:
             result = cls.parse_obj(document)
         except TypeError as e:
@@ -1790,6 +2027,11 @@ class HashModel(RedisModel, abc.ABC):
 
     @classmethod
     def redisearch_schema(cls):
+        # Building the schema walks every field, so do it once per class.
+        return cached_per_class(cls, "_redisearch_schema", cls._build_schema)
+
+    @classmethod
+    def _build_schema(cls) -> str:
         hash_prefix = cls.make_key(cls._meta.primary_key_pattern.format(pk=""))
         schema_prefix = f"ON HASH PREFIX 1 {hash_prefix} SCHEMA"
         schema_parts = [schema_prefix] + cls.schema_for_fields()
@@ -1797,9 +2039,37 @@ class HashModel(RedisModel, abc.ABC):
 
     async def update(self, **field_values):
         validate_model_fields(self.__class__, field_values)
+        await self._update_fields(field_values)
+
+    async def _update_fields(
+        self,
+        field_values: Dict[str, Any],
+        pipeline: Optional[redis.client.Pipeline] = None,
+        stored: bool = False,
+    ):
         for field, value in field_values.items():
             setattr(self, field, value)
-        await self.save()
+
+        # Write the whole model unless we know that a complete hash is already
+        # stored at its key. A partial HSET on a missing key would create a
+        # hash with only the updated fields. Changing the primary key moves
+        # the model to a new key, and a save() override may have its own
+        # logic to run, so those cases also need a full save().
+        if (
+            not stored
+            or type(self)._meta._pk_attr_name in field_values
+            or type(self).save is not HashModel.save
+        ):
+            await self.save(pipeline=pipeline)
+            return
+
+        # Otherwise, validate the whole model but only write the fields that
+        # were updated.
+        self.check()
+        document = hash_document(self, include=set(field_values))
+        if document:
+            db = self._get_db(pipeline)
+            await db.hset(self.key(), mapping=document)
 
     @classmethod
     def schema_for_fields(cls):
@@ -1911,8 +2181,10 @@ class HashModel(RedisModel, abc.ABC):
 
 class JsonModel(RedisModel, abc.ABC):
     def __init_subclass__(cls, **kwargs):
-        # Generate the RediSearch schema once to validate fields.
-        cls.redisearch_schema()
+        # Generate the RediSearch schema fields once to validate them. The
+        # full schema isn't built here because the class's _meta (and thus
+        # its key prefix) is not set up until ModelMeta has finished.
+        cls.schema_for_fields()
 
     def __init__(self, *args, **kwargs):
         if not has_redis_json(self.db()):
@@ -1926,25 +2198,23 @@ class JsonModel(RedisModel, abc.ABC):
         self: "Model", pipeline: Optional[redis.client.Pipeline] = None
     ) -> "Model":
         self.check()
-        db = self._get_db(pipeline)
+        if PYDANTIC_V2:
+            # Dump straight to JSON-compatible Python objects rather than
+            # serializing to a string and parsing it back again.
+            document = self.model_dump(mode="json")
+        else:
+            document = json.loads(self.json())
 
+        # Only the wrapper for the model's own client is cached, so a
+        # pipeline gets its own.
+        commands = json_commands(type(self)) if pipeline is None else pipeline.json()
         # TODO: Wrap response errors in a custom exception?
-        await db.json().set(self.key(), Path.root_path(), json.loads(self.json()))
+        await commands.set(self.key(), Path.root_path(), document)
         return self
 
     @classmethod
     async def all_pks(cls):  # type: ignore
-        key_prefix = cls.make_key(cls._meta.primary_key_pattern.format(pk=""))
-        # TODO: We need to decide how we want to handle the lack of
-        #  decode_responses=True...
-        return (
-            (
-                remove_prefix(key, key_prefix)
-                if isinstance(key, str)
-                else remove_prefix(key.decode(cls.Meta.encoding), key_prefix)
-            )
-            async for key in cls.db().scan_iter(f"{key_prefix}*", _type="ReJSON-RL")
-        )
+        return cls._scan_pks("ReJSON-RL")
 
     async def update(self, **field_values):
         validate_model_fields(self.__class__, field_values)
@@ -1972,13 +2242,38 @@ class JsonModel(RedisModel, abc.ABC):
 
     @classmethod
     async def get(cls: Type["Model"], pk: Any) -> "Model":
-        document = json.dumps(await cls.db().json().get(cls.make_key(pk)))
-        if document == "null":
+        document = await json_commands(cls).get(cls.make_key(pk))
+        if document is None:
             raise NotFoundError
-        return cls.parse_raw(document)
+        return cls._parse_document(document)
+
+    @classmethod
+    async def get_many(
+        cls: Type["Model"], pks: Sequence[Any]
+    ) -> List[Optional["Model"]]:
+        pipeline = cls.db().pipeline(transaction=False)
+        # The pipeline's JSON commands queue on the pipeline, so don't use the
+        # client cached by json_commands() here.
+        json_pipeline = pipeline.json()
+        for pk in pks:
+            await json_pipeline.get(cls.make_key(pk))
+        documents = await pipeline.execute()
+        return [
+            cls._parse_document(document) if document is not None else None
+            for document in documents
+        ]
+
+    @classmethod
+    def _parse_document(cls: Type["Model"], document: Any) -> "Model":
+        return cls.parse_raw(json.dumps(document))
 
     @classmethod
     def redisearch_schema(cls):
+        # Building the schema walks every field, so do it once per class.
+        return cached_per_class(cls, "_redisearch_schema", cls._build_schema)
+
+    @classmethod
+    def _build_schema(cls) -> str:
         key_prefix = cls.make_key(cls._meta.primary_key_pattern.format(pk=""))
         schema_prefix = f"ON JSON PREFIX 1 {key_prefix} SCHEMA"
         schema_parts = [schema_prefix] + cls.schema_for_fields()
@@ -2202,31 +2497,28 @@ class JsonModel(RedisModel, abc.ABC):
                 schema = f"{path} AS {index_field_name} TAG"
             elif any(issubclass(typ, t) for t in NUMERIC_TYPES):
                 schema = f"{path} AS {index_field_name} NUMERIC"
-            elif issubclass(typ, str):
-                if full_text_search is True:
-                    schema = (
-                        f"{path} AS {index_field_name} TAG SEPARATOR {SINGLE_VALUE_TAG_FIELD_SEPARATOR} "
-                        f"{path} AS {index_field_name}_fts TEXT"
-                    )
-                    if sortable is True:
-                        # NOTE: With the current preview release, making a field
-                        # full-text searchable and sortable only makes the TEXT
-                        # field sortable. This means that results for full-text
-                        # search queries can be sorted, but not exact match
-                        # queries.
-                        schema += " SORTABLE"
-                    if case_sensitive is True:
-                        raise RedisModelError("Text fields cannot be case-sensitive.")
-                else:
-                    schema = f"{path} AS {index_field_name} TAG SEPARATOR {SINGLE_VALUE_TAG_FIELD_SEPARATOR}"
-                    if sortable is True:
-                        raise sortable_tag_error
-                    if case_sensitive is True:
-                        schema += " CASESENSITIVE"
+            elif issubclass(typ, str) and full_text_search is True:
+                if case_sensitive is True:
+                    raise RedisModelError("Text fields cannot be case-sensitive.")
+                schema = (
+                    f"{path} AS {index_field_name} TAG SEPARATOR {SINGLE_VALUE_TAG_FIELD_SEPARATOR} "
+                    f"{path} AS {index_field_name}_fts TEXT"
+                )
+                if sortable is True:
+                    # NOTE: With the current preview release, making a field
+                    # full-text searchable and sortable only makes the TEXT
+                    # field sortable. This means that results for full-text
+                    # search queries can be sorted, but not exact match
+                    # queries.
+                    schema += " SORTABLE"
             else:
+                # Strings without full-text search, and any other type we
+                # don't index specially, are indexed as TAG fields.
                 schema = f"{path} AS {index_field_name} TAG SEPARATOR {SINGLE_VALUE_TAG_FIELD_SEPARATOR}"
                 if sortable is True:
                     raise sortable_tag_error
+                if case_sensitive is True:
+                    schema += " CASESENSITIVE"
 
             return schema
         return ""
@@ -1,5 +1,5 @@
 import re
-from typing import Match, Optional, Pattern
+from typing import Dict, Match, Optional, Pattern
 
 
 class TokenEscaper:
@@ -12,12 +12,25 @@ class TokenEscaper:
     DEFAULT_ESCAPED_CHARS = r"[,.<>{}\[\]\\\"\':;!@#$%^&*()\-+=~\/ ]"
 
     def __init__(self, escape_chars_re: Optional[Pattern[str]] = None):
+        self._translation_table: Optional[Dict[int, str]] = None
         if escape_chars_re:
             self.escaped_chars_re = escape_chars_re
         else:
             self.escaped_chars_re = re.compile(self.DEFAULT_ESCAPED_CHARS)
+            # The default character class is a fixed set of single characters,
+            # so we can escape with str.translate instead of running the regex.
+            self._translation_table = str.maketrans(
+                {
+                    char: f"\\{char}"
+                    for char in self.DEFAULT_ESCAPED_CHARS
+                    if self.escaped_chars_re.match(char)
+                }
+            )
 
     def escape(self, value: str) -> str:
+        if self._translation_table is not None:
+            return value.translate(self._translation_table)
+
         def escape_symbol(match: Match[str]) -> str:
             value = match.group(0)
             return f"\\{value}"
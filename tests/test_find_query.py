@@ -282,6 +282,44 @@ async def test_find_query_text_search_and(m, members):
     ]
 
 
+@py_test_mark_asyncio
+async def test_find_query_reorder(m, members):
+    model_name, fq = await FindQuery(
+        expressions=[
+            m.Member.bio % "great",
+            m.Member.age < 40,
+            m.Member.first_name == "Andrew",
+        ],
+        model=m.Member,
+        reorder=True,
+    ).get_query()
+    assert fq == [
+        "FT.SEARCH",
+        model_name,
+        "((@first_name:{Andrew}) (@age:[-inf (40])) (@bio_fts:great)",
+        "LIMIT",
+        0,
+        1000,
+    ]
+
+
+@py_test_mark_asyncio
+async def test_find_query_copy_reorder(m, members):
+    query = FindQuery(
+        expressions=[
+            m.Member.bio % "great",
+            m.Member.age < 40,
+            m.Member.first_name == "Andrew",
+        ],
+        model=m.Member,
+    )
+    assert query.query == "((@bio_fts:great) (@age:[-inf (40])) (@first_name:{Andrew})"
+    assert (
+        query.copy(reorder=True).query
+        == "((@first_name:{Andrew}) (@age:[-inf (40])) (@bio_fts:great)"
+    )
+
+
 @py_test_mark_asyncio
 async def test_find_query_text_search_or(m, members):
     model_name, fq = await FindQuery(
@@ -162,6 +162,31 @@ async def test_delete_non_exist(members, m):
     )
 
 
+@py_test_mark_asyncio
+async def test_delete_more_than_one_page(members, m):
+    member1, member2, member3 = members
+    others = [
+        m.Member(
+            id=i,
+            first_name="Andrew",
+            last_name="Brookins",
+            email=f"{i}@example.com",
+            age=i,
+            join_date=today,
+            bio="This is another member.",
+        )
+        for i in range(10, 15)
+    ]
+    await m.Member.add(others)
+
+    query = m.Member.find(m.Member.last_name == "Brookins").copy(limit=2, page_size=2)
+    assert await query.delete() == 7
+
+    for member in [member1, member2, *others]:
+        assert not await m.Member.db().exists(member.key())
+    assert await m.Member.db().exists(member3.key())
+
+
 @py_test_mark_asyncio
 async def test_full_text_search_queries(members, m):
     member1, member2, member3 = members
@@ -488,6 +513,16 @@ async def test_saves_model_and_creates_pk(m):
     assert member2 == member
 
 
+@py_test_mark_asyncio
+async def test_get_many(members, m):
+    member1, member2, member3 = members
+
+    actual = await m.Member.get_many([member3.id, 1000, member1.id, member2.id])
+    assert actual == [member3, None, member1, member2]
+
+    assert await m.Member.get_many([]) == []
+
+
 @py_test_mark_asyncio
 async def test_all_pks(m):
     member = m.Member(
@@ -699,6 +734,62 @@ async def test_updates_a_model(members, m):
     assert member.last_name == "Smith"
 
 
+@py_test_mark_asyncio
+async def test_update_keeps_other_fields(members, m):
+    member1, member2, member3 = members
+    before = await m.Member.db().hgetall(member1.key())
+    await member1.update(last_name="Smith")
+    after = await m.Member.db().hgetall(member1.key())
+    assert after == {**before, "last_name": "Smith"}
+
+
+@py_test_mark_asyncio
+async def test_update_primary_key_writes_whole_model(members, m):
+    member1, member2, member3 = members
+    before = await m.Member.db().hgetall(member1.key())
+    await member1.update(id=1000)
+    after = await m.Member.db().hgetall(m.Member.make_primary_key(1000))
+    assert after == {**before, "id": "1000"}
+    assert await m.Member.get(1000) == member1
+
+
+@py_test_mark_asyncio
+async def test_update_unsaved_model_writes_whole_model(m):
+    member = m.Member(
+        id=1000,
+        first_name="Andrew",
+        last_name="Brookins",
+        email="a@example.com",
+        join_date=today,
+        age=38,
+        bio="This is the bio field for this user.",
+    )
+    await member.update(age=39)
+    assert await m.Member.get(1000) == member
+
+
+async def _check_query_update(members, m, use_transaction):
+    db = m.Member.db()
+    before = [await db.hgetall(member.key()) for member in members]
+
+    await m.Member.find(m.Member.last_name == "Brookins").update(
+        use_transaction=use_transaction, age=50
+    )
+
+    after = [await db.hgetall(member.key()) for member in members]
+    assert after == [{**before[0], "age": "50"}, {**before[1], "age": "50"}, before[2]]
+
+
+@py_test_mark_asyncio
+async def test_update_query_with_transaction(members, m):
+    await _check_query_update(members, m, use_transaction=True)
+
+
+@py_test_mark_asyncio
+async def test_update_query_without_transaction(members, m):
+    await _check_query_update(members, m, use_transaction=False)
+
+
 @py_test_mark_asyncio
 async def test_paginate_query(members, m):
     member1, member2, member3 = members
@@ -706,6 +797,45 @@ async def test_paginate_query(members, m):
     assert actual == [member2, member1, member3]
 
 
+@py_test_mark_asyncio
+async def test_paginate_query_across_pipeline_batches(m):
+    # With two results per page, 20 members need more pages than are sent in
+    # one pipeline.
+    members = [
+        m.Member(
+            id=i,
+            first_name="Andrew",
+            last_name="Brookins",
+            email=f"{i}@example.com",
+            age=i,
+            join_date=today,
+            bio="This is a member.",
+        )
+        for i in range(20)
+    ]
+    await m.Member.add(members)
+
+    actual = await m.Member.find().sort_by("-age").all(batch_size=2)
+    assert actual == members[::-1]
+
+
+@py_test_mark_asyncio
+async def test_iterate_query_pages(members, m):
+    member1, member2, member3 = members
+    query = m.Member.find().sort_by("age").copy(limit=1, page_size=1)
+    assert [member async for member in query] == [member2, member1, member3]
+
+
+@py_test_mark_asyncio
+async def test_iterate_query_break_leaves_cache_empty(members, m):
+    member1, member2, member3 = members
+    query = m.Member.find().sort_by("age").copy(limit=1, page_size=1)
+    async for member in query:
+        break
+    assert member == member2
+    assert query._model_cache == []
+
+
 @py_test_mark_asyncio
 async def test_access_result_by_index_cached(members, m):
     member1, member2, member3 = members
@@ -224,6 +224,16 @@ async def test_saves_model_and_creates_pk(address, m, redis):
     assert member2.address == address
 
 
+@py_test_mark_asyncio
+async def test_get_many(members, m):
+    member1, member2, member3 = members
+
+    actual = await m.Member.get_many([member3.pk, "missing", member1.pk, member2.pk])
+    assert actual == [member3, None, member1, member2]
+
+    assert await m.Member.get_many([]) == []
+
+
 @py_test_mark_asyncio
 async def test_all_pks(address, m, redis):
     member = m.Member(